@@ -0,0 +1,18 @@
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """Assign xdist scheduling groups (pytest runs with --dist loadgroup).
+
+    By default every test is grouped by its module, which keeps the old
+    loadfile behavior: a module's session-scoped fixtures are built on one
+    worker only. Selenium tests instead group by their browser param, so
+    the Chrome and Firefox matrices run concurrently on separate workers.
+    """
+    for item in items:
+        browser = None
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None:
+            browser = callspec.params.get("selenium_browser")
+        group = f"selenium-{browser}" if browser else item.nodeid.split("::", 1)[0]
+        item.add_marker(pytest.mark.xdist_group(name=group))
@@ -0,0 +1,110 @@
+# Shared fixtures for the course app test suite.
+#
+# The users and course below are session-scoped: they are inserted exactly
+# once per test run (outside the per-test transaction, via django_db_blocker)
+# instead of re-running create_user + the password hasher for every test.
+# Each test still executes inside the transaction that pytest.mark.django_db
+# opens and rolls back, so per-test writes never leak into these shared rows.
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.test import Client, override_settings
+
+from accounts.models import CustomUser
+from dashboard.models import Course
+
+# create_user runs the default PBKDF2 hasher (~100ms per user) for passwords
+# no test ever cracks. MD5 is insecure but instant, which is exactly what we
+# want for throwaway test credentials.
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hashers():
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def _seed_users(django_db_setup, django_db_blocker, fast_password_hashers):
+    """Build all three test users unsaved and insert them in one round trip."""
+    # Hash the shared test password once; every user gets the same
+    # pre-computed hash instead of re-running the hasher per create.
+    password_hash = make_password("strong-pass")
+    users = [
+        CustomUser(
+            username="prof_jane",
+            email="prof@example.com",
+            password=password_hash,
+            user_type=CustomUser.PROFESSOR,
+        ),
+        CustomUser(
+            username="prof_john",
+            email="prof2@example.com",
+            password=password_hash,
+            user_type=CustomUser.PROFESSOR,
+        ),
+        CustomUser(
+            username="stud_mia",
+            email="student@example.com",
+            password=password_hash,
+            user_type=CustomUser.STUDENT,
+        ),
+    ]
+    with django_db_blocker.unblock():
+        # --reuse-db leaves these rows behind on a persistent backend
+        # (Postgres), so clear any previous run's copies first — otherwise
+        # the insert hits the unique username constraint. Cascades take the
+        # stale session-scoped course and login sessions with them.
+        CustomUser.objects.filter(
+            username__in=[u.username for u in users]
+        ).delete()
+        CustomUser.objects.bulk_create(users)
+    return {u.username: u for u in users}
+
+@pytest.fixture(scope="session")
+def professor_user(_seed_users):
+    return _seed_users["prof_jane"]
+
+@pytest.fixture(scope="session")
+def other_professor(_seed_users):
+    return _seed_users["prof_john"]
+
+@pytest.fixture(scope="session")
+def student_user(_seed_users):
+    return _seed_users["stud_mia"]
+
+
+# Pre-authenticated clients, one per user. force_login writes a session row
+# and dispatches the login signals, so doing it once per run instead of once
+# per test saves a session-save round trip everywhere.
+
+@pytest.fixture(scope="session")
+def prof_client(professor_user, django_db_blocker):
+    with django_db_blocker.unblock():
+        c = Client()
+        c.force_login(professor_user)
+        return c
+
+@pytest.fixture(scope="session")
+def other_prof_client(other_professor, django_db_blocker):
+    with django_db_blocker.unblock():
+        c = Client()
+        c.force_login(other_professor)
+        return c
+
+@pytest.fixture(scope="session")
+def student_client(student_user, django_db_blocker):
+    with django_db_blocker.unblock():
+        c = Client()
+        c.force_login(student_user)
+        return c
+
+@pytest.fixture(scope="session")
+def course(professor_user, django_db_blocker):
+    with django_db_blocker.unblock():
+        return Course.objects.create(
+            title="Software Engineering",
+            code="CSCI-3333",
+            semester="Fall",
+            year=2030,
+            professor=professor_user,
+        )
@@ -1,6 +1,13 @@
 # === HELPER FUNCTIONS for views.py ===
 from .models import Likert, OpenEnded
 
+def parse_counts(data):
+    """
+    Parses the num_likert / num_open_ended question counts from POST data.
+    Raises ValueError if either count is not an integer.
+    """
+    return int(data.get("num_likert", 0)), int(data.get("num_open_ended", 0))
+
 def rebuild_likert_questions(request, course_form):
     """
     Deletes all existing Likert questions for the course_form and re-creates them
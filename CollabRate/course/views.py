@@ -169,8 +169,7 @@ def create_form(request, join_code):
     if request.method == "POST":
         name = request.POST.get("form_name", "Untitled Form")
         self_evaluate = "self_evaluate" in request.POST
-        num_likert = int(request.POST.get("num_likert", 0))
-        num_open_ended = int(request.POST.get("num_open_ended", 0))
+        num_likert, num_open_ended = parse_counts(request.POST)
 
         due_dt_str = request.POST.get("due_datetime")
         print(due_dt_str)
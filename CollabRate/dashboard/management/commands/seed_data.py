@@ -1,383 +1,779 @@
-import math
-import random
-import uuid
-from datetime import datetime
-import time
-
-from django.core.management.base import BaseCommand, CommandError
-from django.contrib.auth import get_user_model
-from django.db import transaction
-
-from dashboard.models import Course
-from course.models import Team
-
-try:
-    from allauth.account.models import EmailAddress
-    from allauth.socialaccount.models import SocialAccount
-except Exception:  # pragma: no cover - allauth optional at seed time
-    EmailAddress = None
-    SocialAccount = None
-
-
-LEVEL_CONFIG = {
-    1: {
-        "courses_per_semester": 150,
-        "students_min": 30,
-        "students_max": 80,
-        "team_min": 4,
-        "team_max": 8,
-    },
-    2: {
-        "courses_per_semester": 700,
-        "students_min": 30,
-        "students_max": 80,
-        "team_min": 4,
-        "team_max": 6,
-    },
-    3: {
-        "courses_per_semester": 2000,
-        "students_min": 30,
-        "students_max": 100,
-        "team_min": 4,
-        "team_max": 6,
-    },
-}
-
-
-def chunk_list(items, chunk_size):
-    for i in range(0, len(items), chunk_size):
-        yield items[i : i + chunk_size]
-
-
-class Command(BaseCommand):
-    help = (
-        "Seed database with sample data: users (students/professors), courses, teams.\n"
-        "Usage: python manage.py seed_data --level 1 --semester Spring --year 2025"
-    )
-
-    def add_arguments(self, parser):
-        parser.add_argument(
-            "--level",
-            type=int,
-            choices=[1, 2, 3],
-            default=1,
-            help="Load level 1/2/3 data volume",
-        )
-        parser.add_argument(
-            "--semester",
-            type=str,
-            choices=["Spring", "Fall"],
-            default="Spring",
-            help="Target semester",
-        )
-        parser.add_argument(
-            "--year",
-            type=int,
-            default=datetime.utcnow().year,
-            help="Target year",
-        )
-        parser.add_argument(
-            "--seed",
-            type=int,
-            default=42,
-            help="Random seed for reproducibility",
-        )
-        parser.add_argument(
-            "--with-allauth",
-            action="store_true",
-            help="Create EmailAddress and SocialAccount rows for users",
-        )
-        parser.add_argument(
-            "--fast-passwords",
-            action="store_true",
-            help="Assign unusable passwords (no hashing) to speed up large runs",
-        )
-        parser.add_argument(
-            "--purge",
-            action="store_true",
-            help="Clear all existing data before seeding (users, courses, teams, allauth records)",
-        )
-        parser.add_argument(
-            "--help-detailed",
-            action="store_true",
-            help="Show detailed help with examples and level configurations",
-        )
-
-    def handle(self, *args, **options):
-        # Show detailed help if requested
-        if options["help_detailed"]:
-            self.show_detailed_help()
-            return
-
-        level = options["level"]
-        semester = options["semester"]
-        year = options["year"]
-        seed = options["seed"]
-        with_allauth = options["with_allauth"]
-        fast_passwords = options["fast_passwords"]
-        purge = options["purge"]
-
-        if with_allauth and (EmailAddress is None or SocialAccount is None):
-            raise CommandError(
-                "django-allauth not available but --with-allauth was specified"
-            )
-
-        random.seed(seed)
-
-        # Purge existing data if requested
-        if purge:
-            self.stdout.write(self.style.WARNING("Purging existing data..."))
-            
-            # Delete in reverse dependency order to avoid foreign key constraints
-            if SocialAccount is not None:
-                deleted_social = SocialAccount.objects.all().delete()
-                self.stdout.write(f"Deleted {deleted_social[0]} SocialAccount records")
-            
-            if EmailAddress is not None:
-                deleted_emails = EmailAddress.objects.all().delete()
-                self.stdout.write(f"Deleted {deleted_emails[0]} EmailAddress records")
-            
-            # Delete teams first (they reference courses and users)
-            deleted_teams = Team.objects.all().delete()
-            self.stdout.write(f"Deleted {deleted_teams[0]} Team records")
-            
-            # Delete courses (they reference users)
-            deleted_courses = Course.objects.all().delete()
-            self.stdout.write(f"Deleted {deleted_courses[0]} Course records")
-            
-            # Delete all users
-            User = get_user_model()
-            deleted_users = User.objects.all().delete()
-            self.stdout.write(f"Deleted {deleted_users[0]} User records")
-            
-            self.stdout.write(self.style.SUCCESS("Purge completed"))
-
-        config = LEVEL_CONFIG[level]
-        courses_target = config["courses_per_semester"]
-        students_min = config["students_min"]
-        students_max = config["students_max"]
-        team_min = config["team_min"]
-        team_max = config["team_max"]
-
-        self.stdout.write(
-            self.style.NOTICE(
-                f"Seeding level {level}: ~{courses_target} courses in {semester} {year}"
-            )
-        )
-
-        User = get_user_model()
-
-        created_courses = []
-        created_professors = []
-        created_students = []
-        created_teams = []
-        created_email_addresses = []
-        created_social_accounts = []
-
-        username_counter = int(random.random() * 1000)
-        email_domain = "student.example.edu"
-        prof_domain = "faculty.example.edu"
-
-        def next_username(prefix: str) -> str:
-            nonlocal username_counter
-            username_counter += 1
-            return f"{prefix}{username_counter}"
-
-        def make_email(local: str, domain: str) -> str:
-            return f"{local}@{domain}"
-
-        # We create objects inside a transaction for speed and atomicity
-        with transaction.atomic():
-            start_time = time.time()
-            progress_every = max(1, courses_target // 20)  # ~5% increments
-            for course_index in range(courses_target):
-                course_code = f"CS{100 + (course_index % 400)}"
-                course_title = f"Course {course_code} Section {course_index % 5}"
-
-                # Professor
-                prof_username = next_username("prof_")
-                prof_email = make_email(prof_username, prof_domain)
-                professor = User(
-                    username=prof_username,
-                    email=prof_email,
-                    user_type=getattr(User, "PROFESSOR", "professor"),
-                )
-                if fast_passwords:
-                    professor.set_unusable_password()
-                else:
-                    professor.set_password("Passw0rd!")
-                professor.save()
-                created_professors.append(professor)
-
-                # Course
-                course = Course(
-                    code=course_code,
-                    title=course_title,
-                    semester=semester,
-                    year=year,
-                    professor=professor,
-                )
-                course.save()
-                created_courses.append(course)
-
-                # Students for this course
-                num_students = random.randint(students_min, students_max)
-                students_for_course = []
-                for _ in range(num_students):
-                    stu_username = next_username("student_")
-                    stu_email = make_email(stu_username, email_domain)
-                    student = User(
-                        username=stu_username,
-                        email=stu_email,
-                        user_type=getattr(User, "STUDENT", "student"),
-                    )
-                    if fast_passwords:
-                        student.set_unusable_password()
-                    else:
-                        student.set_password("Passw0rd!")
-                    student.save()
-                    students_for_course.append(student)
-                    created_students.append(student)
-
-                # Enroll students
-                course.students.add(*students_for_course)
-                course.student_count = len(students_for_course)
-                course.save(update_fields=["student_count"])
-
-                # Teams: choose a team size in range and partition students
-                preferred_team_size = random.randint(team_min, team_max)
-                random.shuffle(students_for_course)
-                teams_needed = max(1, math.ceil(len(students_for_course) / preferred_team_size))
-
-                # Distribute students as evenly as possible
-                for team_num in range(teams_needed):
-                    team = Team(name=f"Team {team_num + 1}", course=course)
-                    team.save()
-                    created_teams.append(team)
-
-                # Assign students to teams round-robin
-                for idx, student in enumerate(students_for_course):
-                    team = created_teams[-teams_needed + (idx % teams_needed)]
-                    team.students.add(student)
-
-                # Optionally create allauth records
-                if with_allauth:
-                    for u in [professor] + students_for_course:
-                        if EmailAddress is not None:
-                            created_email_addresses.append(
-                                EmailAddress(user=u, email=u.email, verified=True, primary=True)
-                            )
-                        if SocialAccount is not None:
-                            created_social_accounts.append(
-                                SocialAccount(
-                                    user=u,
-                                    provider="google",
-                                    uid=f"google-oauth2|{uuid.uuid4()}",
-                                    extra_data={
-                                        "email": u.email,
-                                        "name": u.username.replace("_", " "),
-                                    },
-                                )
-                            )
-
-                # Periodic progress update
-                if (course_index + 1) % progress_every == 0 or (course_index + 1) == courses_target:
-                    elapsed = time.time() - start_time
-                    pct = ((course_index + 1) / courses_target) * 100.0
-                    self.stdout.write(
-                        self.style.NOTICE(
-                            f"Created courses: {course_index + 1}/{courses_target} ({pct:0.1f}%) in {elapsed:0.1f}s"
-                        )
-                    )
-
-            # Bulk create allauth rows in chunks to avoid large INSERTs
-            if with_allauth:
-                if EmailAddress is not None and created_email_addresses:
-                    total = len(created_email_addresses)
-                    done = 0
-                    for batch in chunk_list(created_email_addresses, 1000):
-                        EmailAddress.objects.bulk_create(batch, ignore_conflicts=True)
-                        done += len(batch)
-                        self.stdout.write(self.style.NOTICE(f"EmailAddress bulk: {done}/{total}"))
-                if SocialAccount is not None and created_social_accounts:
-                    total = len(created_social_accounts)
-                    done = 0
-                    for batch in chunk_list(created_social_accounts, 1000):
-                        SocialAccount.objects.bulk_create(batch, ignore_conflicts=True)
-                        done += len(batch)
-                        self.stdout.write(self.style.NOTICE(f"SocialAccount bulk: {done}/{total}"))
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Created {len(created_courses)} courses, "
-                f"{len(created_professors)} professors, {len(created_students)} students, "
-                f"{len(created_teams)} teams"
-            )
-        )
-
-    def show_detailed_help(self):
-        """Display detailed help information with examples and configurations."""
-        self.stdout.write(self.style.SUCCESS("CollabRate Data Seeding Command"))
-        self.stdout.write("=" * 50)
-        self.stdout.write("")
-        
-        self.stdout.write(self.style.WARNING("USAGE:"))
-        self.stdout.write("  python manage.py seed_data [OPTIONS]")
-        self.stdout.write("")
-        
-        self.stdout.write(self.style.WARNING("OPTIONS:"))
-        self.stdout.write("  --level {1,2,3}           Data volume level (default: 1)")
-        self.stdout.write("    Level 1: ~150 courses, 30-80 students, teams 4-8")
-        self.stdout.write("    Level 2: ~700 courses, 30-80 students, teams 4-6") 
-        self.stdout.write("    Level 3: ~2000 courses, 30-100 students, teams 4-6")
-        self.stdout.write("")
-        
-        self.stdout.write("  --semester {Spring,Fall}  Target semester (default: Spring)")
-        self.stdout.write("  --year YYYY              Target year (default: current year)")
-        self.stdout.write("  --seed N                 Random seed for reproducibility (default: 42)")
-        self.stdout.write("")
-        
-        self.stdout.write("  --with-allauth           Create EmailAddress and SocialAccount records")
-        self.stdout.write("                          (simulates Google OAuth users)")
-        self.stdout.write("  --fast-passwords         Use unusable passwords for speed")
-        self.stdout.write("                          (users can only login via social auth)")
-        self.stdout.write("  --purge                  Clear all existing data before seeding")
-        self.stdout.write("")
-        
-        self.stdout.write(self.style.WARNING("EXAMPLES:"))
-        self.stdout.write("  # Quick Level 1 test")
-        self.stdout.write("  python manage.py seed_data --level 1 --fast-passwords")
-        self.stdout.write("")
-        
-        self.stdout.write("  # Full Level 2 with allauth and purge")
-        self.stdout.write("  python manage.py seed_data --level 2 --with-allauth --purge --fast-passwords")
-        self.stdout.write("")
-        
-        self.stdout.write("  # Level 3 for stress testing")
-        self.stdout.write("  python manage.py seed_data --level 3 --semester Fall --year 2025 --fast-passwords")
-        self.stdout.write("")
-        
-        self.stdout.write(self.style.WARNING("PERFORMANCE NOTES:"))
-        self.stdout.write("  - Use --fast-passwords for large datasets (Level 2/3)")
-        self.stdout.write("  - --with-allauth adds extra time for social account creation")
-        self.stdout.write("  - Level 1: ~1-3 minutes, Level 2: ~5-20 minutes, Level 3: ~20-60+ minutes")
-        self.stdout.write("  - Progress updates shown every ~5% of courses")
-        self.stdout.write("")
-        
-        self.stdout.write(self.style.WARNING("DATA GENERATED:"))
-        self.stdout.write("  - CustomUser records (students and professors)")
-        self.stdout.write("  - Course records with join codes and colors")
-        self.stdout.write("  - Team records with student assignments")
-        self.stdout.write("  - Optional: EmailAddress and SocialAccount records")
-        self.stdout.write("")
-        
-        self.stdout.write(self.style.WARNING("DATABASE TABLES AFFECTED:"))
-        self.stdout.write("  - accounts_customuser (users)")
-        self.stdout.write("  - dashboard_course (courses)")
-        self.stdout.write("  - course_team (teams)")
-        self.stdout.write("  - course_team_students (team memberships)")
-        self.stdout.write("  - dashboard_course_students (course enrollments)")
-        if EmailAddress is not None:
-            self.stdout.write("  - account_emailaddress (if --with-allauth)")
-        if SocialAccount is not None:
-            self.stdout.write("  - socialaccount_socialaccount (if --with-allauth)")
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import random
+from datetime import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from dashboard.models import Course, generate_join_code
+from course.models import Team
+
+try:
+    from allauth.account.models import EmailAddress
+    from allauth.socialaccount.models import SocialAccount
+except Exception:  # pragma: no cover - allauth optional at seed time
+    EmailAddress = None
+    SocialAccount = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy optional at seed time
+    np = None
+
+
+LEVEL_CONFIG = {
+    1: {
+        "courses_per_semester": 150,
+        "students_min": 30,
+        "students_max": 80,
+        "team_min": 4,
+        "team_max": 8,
+    },
+    2: {
+        "courses_per_semester": 700,
+        "students_min": 30,
+        "students_max": 80,
+        "team_min": 4,
+        "team_max": 6,
+    },
+    3: {
+        "courses_per_semester": 2000,
+        "students_min": 30,
+        "students_max": 100,
+        "team_min": 4,
+        "team_max": 6,
+    },
+}
+
+
+@contextmanager
+def _post_save_disconnected(models):
+    """Detach post_save receivers registered against the given senders.
+
+    bulk_create and COPY never fire save signals, but third-party apps can
+    hook the user model and would run per-row on any stray save() during the
+    seed; detaching for the duration keeps the hot path signal-free.
+    Receivers are restored on exit.
+    """
+    stashed = []
+    for model in models:
+        sync_receivers, async_receivers = post_save._live_receivers(model)
+        for receiver in (*sync_receivers, *async_receivers):
+            post_save.disconnect(receiver, sender=model)
+            stashed.append((receiver, model))
+    try:
+        yield
+    finally:
+        for receiver, model in stashed:
+            post_save.connect(receiver, sender=model)
+
+
+
+def seed_course_range(
+    course_start,
+    courses_count,
+    username_base,
+    config,
+    semester,
+    year,
+    seed,
+    with_allauth,
+    shared_password,
+    batch_size=1000,
+    stdout=None,
+    style=None,
+):
+    """Seed one contiguous slice of courses and return created-object counts.
+
+    This is the whole per-course pipeline (users, course, teams, memberships,
+    optional allauth rows) for course indexes [course_start, course_start +
+    courses_count). It runs inline for serial seeds and inside each worker
+    process for --parallel runs, so it takes only picklable arguments and
+    writes progress only when handed the command's stdout/style.
+    """
+    User = get_user_model()
+    random.seed(seed)
+
+    students_min = config["students_min"]
+    students_max = config["students_max"]
+    team_min = config["team_min"]
+    team_max = config["team_max"]
+
+    # Draw every per-course random count up front — two vectorized C loops
+    # with numpy, or a pair of comprehensions when it is not installed —
+    # instead of re-entering the Mersenne Twister per course.
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        students_per_course = rng.integers(
+            students_min, students_max + 1, size=courses_count
+        ).tolist()
+        team_size_per_course = rng.integers(
+            team_min, team_max + 1, size=courses_count
+        ).tolist()
+    else:
+        students_per_course = [
+            random.randint(students_min, students_max) for _ in range(courses_count)
+        ]
+        team_size_per_course = [
+            random.randint(team_min, team_max) for _ in range(courses_count)
+        ]
+
+    # Resolve the user-type constants once; the getattr fallback only
+    # matters for swapped user models without them, not per user created.
+    professor_type = getattr(User, "PROFESSOR", "professor")
+    student_type = getattr(User, "STUDENT", "student")
+
+    # Plain counters for the final summary; keeping every created instance
+    # in a list just to len() it would pin O(N_users) model objects in RAM
+    # for the whole run.
+    n_courses = n_professors = n_students = n_teams = 0
+
+    username_counter = username_base
+    email_domain = "student.example.edu"
+    prof_domain = "faculty.example.edu"
+
+    # Usernames and emails are generated in batches with list comprehensions
+    # rather than a per-call closure: the counter is advanced once per batch
+    # instead of once per user, and the f-string work runs in a tight
+    # comprehension loop. One professor name per course is allocated up front.
+    prof_base = username_counter + 1
+    prof_usernames = [f"prof_{prof_base + i}" for i in range(courses_count)]
+    prof_emails = [f"{u}@{prof_domain}" for u in prof_usernames]
+    username_counter += courses_count
+
+    # Only 400 codes x 5 sections = 2000 distinct (code, title) pairs exist,
+    # so build the table once and index it instead of re-formatting per course.
+    codes = [f"CS{100 + i}" for i in range(400)]
+    course_names = [
+        (codes[i % 400], f"Course {codes[i % 400]} Section {i % 5}")
+        for i in range(2000)
+    ]
+
+    # On Postgres, user rows go through COPY ... FROM STDIN, which skips
+    # per-statement parse/plan work entirely; other backends keep the
+    # bulk_create path. IDs are drawn from the sequence up front so the
+    # COPY rows carry their PKs and the instances stay usable for the
+    # M2M wiring below.
+    user_table = User._meta.db_table
+
+    def insert_users(user_objs):
+        if connection.vendor != "postgresql":
+            User.objects.bulk_create(user_objs, batch_size=batch_size)
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                "FROM generate_series(1, %s)",
+                [user_table, len(user_objs)],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+        now = timezone.now().isoformat()
+        buf = io.StringIO()
+        for user, pk in zip(user_objs, ids):
+            user.id = pk
+            # Text-format COPY row; seeded values never contain tabs or
+            # backslashes, so no escaping pass is needed.
+            buf.write(
+                f"{pk}\t{user.password}\t\\N\tf\t{user.username}\t\t\t"
+                f"{user.email}\tf\tt\t{now}\t{user.user_type}\n"
+            )
+        buf.seek(0)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {user_table} "
+                "(id, password, last_login, is_superuser, username, "
+                "first_name, last_name, email, is_staff, is_active, "
+                "date_joined, user_type) FROM STDIN WITH (FORMAT text)",
+                buf,
+            )
+
+    # M2M rows are written straight to the auto-generated through models,
+    # buffered across courses and flushed in batches instead of one
+    # students.add() round trip per course/team.
+    EnrollmentThrough = Course.students.through
+    TeamThrough = Team.students.through
+    pending_enrollments = []
+    pending_team_members = []
+
+    # Allauth rows are streamed the same way: buffered per course and
+    # flushed once a batch is full, never accumulated for the whole run.
+    # The uid prefix is a pre-bound format method, one attribute lookup
+    # for the whole run instead of one f-string parse per user.
+    fmt_uid = "google-oauth2|{}".format
+    pending_email = []
+    pending_social = []
+
+    def flush_allauth():
+        if pending_email:
+            EmailAddress.objects.bulk_create(
+                pending_email, batch_size=batch_size, ignore_conflicts=True
+            )
+            pending_email.clear()
+        if pending_social:
+            SocialAccount.objects.bulk_create(
+                pending_social, batch_size=batch_size, ignore_conflicts=True
+            )
+            pending_social.clear()
+
+    def flush_m2m():
+        if pending_enrollments:
+            EnrollmentThrough.objects.bulk_create(
+                pending_enrollments, batch_size=batch_size, ignore_conflicts=True
+            )
+            pending_enrollments.clear()
+        if pending_team_members:
+            TeamThrough.objects.bulk_create(
+                pending_team_members, batch_size=batch_size, ignore_conflicts=True
+            )
+            pending_team_members.clear()
+
+    # Courses are buffered and flushed with bulk_create as well. Their
+    # join_code primary keys are generated client-side (mirroring
+    # Course.save), so enrollment rows can reference a course before its
+    # INSERT is flushed; teams are bulk-inserted right after their course
+    # batch because team PKs are only known once the rows exist.
+    existing_join_codes = set(Course.objects.values_list("join_code", flat=True))
+
+    def new_join_code():
+        code = generate_join_code()
+        while code in existing_join_codes:
+            code = generate_join_code()
+        existing_join_codes.add(code)
+        return code
+
+    # Per-batch records of (course, students, teams_needed)
+    course_batch = []
+
+    def flush_courses():
+        if not course_batch:
+            return
+        Course.objects.bulk_create(
+            [course for course, _, _ in course_batch], batch_size=batch_size
+        )
+        teams = []
+        for course, _, teams_needed in course_batch:
+            teams.extend(
+                Team(name=f"Team {team_num + 1}", course=course)
+                for team_num in range(teams_needed)
+            )
+        Team.objects.bulk_create(teams, batch_size=batch_size)
+        nonlocal n_teams
+        n_teams += len(teams)
+
+        # Wire up enrollments and round-robin team memberships now that
+        # both course and team PKs exist.
+        team_offset = 0
+        for course, students, teams_needed in course_batch:
+            course_teams = teams[team_offset : team_offset + teams_needed]
+            team_offset += teams_needed
+            pending_enrollments.extend(
+                EnrollmentThrough(course_id=course.pk, customuser_id=s.id)
+                for s in students
+            )
+            pending_team_members.extend(
+                TeamThrough(
+                    team_id=course_teams[idx % teams_needed].id,
+                    customuser_id=student.id,
+                )
+                for idx, student in enumerate(students)
+            )
+        course_batch.clear()
+        flush_m2m()
+
+    # We create objects inside a transaction for speed and atomicity
+    with _post_save_disconnected((User, Course, Team)), transaction.atomic():
+        start_time = time.time()
+        progress_every = max(1, courses_count // 20)  # ~5% increments
+        for offset in range(courses_count):
+            course_index = course_start + offset
+            course_code, course_title = course_names[course_index % 2000]
+
+            # One timestamp per course; leaving date_joined to its default
+            # would call timezone.now() once per instance in __init__.
+            now = timezone.now()
+
+            # Professor
+            professor = User(
+                username=prof_usernames[offset],
+                email=prof_emails[offset],
+                user_type=professor_type,
+                password=shared_password,
+                date_joined=now,
+            )
+
+            # Students for this course, named in one batch
+            num_students = students_per_course[offset]
+            stu_base = username_counter + 1
+            username_counter += num_students
+            stu_usernames = [f"student_{stu_base + i}" for i in range(num_students)]
+            students_for_course = [
+                User(
+                    username=username,
+                    email=f"{username}@{email_domain}",
+                    user_type=student_type,
+                    password=shared_password,
+                    date_joined=now,
+                )
+                for username in stu_usernames
+            ]
+
+            # One round trip for the professor and every student in this
+            # course instead of one .save() per user: COPY on Postgres,
+            # bulk_create elsewhere (which populates PKs on backends that
+            # return IDs, e.g. SQLite 3.35+).
+            insert_users([professor] + students_for_course)
+            n_professors += 1
+            n_students += num_students
+
+            # Course: student_count is known up front, so the row is
+            # built complete and buffered — no second save() to update it.
+            # join_code and color are set here because bulk_create skips
+            # Course.save(), which normally fills them in.
+            course = Course(
+                join_code=new_join_code(),
+                code=course_code,
+                title=course_title,
+                student_count=num_students,
+                semester=semester,
+                year=year,
+                color=random.choice(Course.COLOR_CHOICES),
+                professor=professor,
+            )
+            n_courses += 1
+
+            # Teams: choose a team size in range and partition students.
+            # No shuffle: the students were just generated in arbitrary
+            # order, so index-modulo assignment is already unbiased.
+            preferred_team_size = team_size_per_course[offset]
+            teams_needed = max(1, math.ceil(num_students / preferred_team_size))
+
+            course_batch.append((course, students_for_course, teams_needed))
+            if len(course_batch) >= 500:
+                flush_courses()
+
+            # Optionally create allauth records
+            if with_allauth:
+                course_users = [professor] + students_for_course
+                # One getrandom() syscall covers every social uid for the
+                # course; uuid.uuid4() would re-enter os.urandom per user.
+                uid_hex = os.urandom(16 * len(course_users)).hex()
+                for i, u in enumerate(course_users):
+                    if EmailAddress is not None:
+                        pending_email.append(
+                            EmailAddress(user=u, email=u.email, verified=True, primary=True)
+                        )
+                    if SocialAccount is not None:
+                        pending_social.append(
+                            SocialAccount(
+                                user=u,
+                                provider="google",
+                                uid=fmt_uid(uid_hex[i * 32:(i + 1) * 32]),
+                                extra_data={
+                                    "email": u.email,
+                                    # Usernames hold exactly one underscore
+                                    # (the role prefix); cap the scan there.
+                                    "name": u.username.replace("_", " ", 1),
+                                },
+                            )
+                        )
+                if len(pending_email) >= batch_size or len(pending_social) >= batch_size:
+                    flush_allauth()
+
+            # Periodic progress update (serial runs only; workers stay quiet)
+            if stdout is not None and (
+                (offset + 1) % progress_every == 0 or (offset + 1) == courses_count
+            ):
+                elapsed = time.time() - start_time
+                pct = ((offset + 1) / courses_count) * 100.0
+                stdout.write(
+                    style.NOTICE(
+                        f"Created courses: {offset + 1}/{courses_count} ({pct:0.1f}%) in {elapsed:0.1f}s"
+                    )
+                )
+
+        flush_courses()
+        flush_allauth()
+
+    return {
+        "courses": n_courses,
+        "professors": n_professors,
+        "students": n_students,
+        "teams": n_teams,
+    }
+
+
+def _seed_range_worker(kwargs):
+    # Forked workers inherit the parent's DB socket; drop it so each process
+    # opens its own connection before touching the ORM.
+    connections.close_all()
+    return seed_course_range(**kwargs)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed database with sample data: users (students/professors), courses, teams.\n"
+        "Usage: python manage.py seed_data --level 1 --semester Spring --year 2025"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--level",
+            type=int,
+            choices=[1, 2, 3],
+            default=1,
+            help="Load level 1/2/3 data volume",
+        )
+        parser.add_argument(
+            "--semester",
+            type=str,
+            choices=["Spring", "Fall"],
+            default="Spring",
+            help="Target semester",
+        )
+        parser.add_argument(
+            "--year",
+            type=int,
+            default=datetime.utcnow().year,
+            help="Target year",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Random seed for reproducibility",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help=(
+                "Rows per bulk_create statement (default: "
+                "SEED_BULK_CREATE_BATCH_SIZE env var, else sized to keep "
+                "each statement near 64 KB of SQL)"
+            ),
+        )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=1,
+            help=(
+                "Number of worker processes seeding disjoint course ranges. "
+                "Keep below the database's max_connections."
+            ),
+        )
+        parser.add_argument(
+            "--with-allauth",
+            action="store_true",
+            help="Create EmailAddress and SocialAccount rows for users",
+        )
+        parser.add_argument(
+            "--fast-passwords",
+            action="store_true",
+            help="Assign unusable passwords (no hashing) to speed up large runs",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Clear all existing data before seeding (users, courses, teams, allauth records)",
+        )
+        parser.add_argument(
+            "--help-detailed",
+            action="store_true",
+            help="Show detailed help with examples and level configurations",
+        )
+
+    def handle(self, *args, **options):
+        # Show detailed help if requested
+        if options["help_detailed"]:
+            self.show_detailed_help()
+            return
+
+        level = options["level"]
+        semester = options["semester"]
+        year = options["year"]
+        seed = options["seed"]
+        with_allauth = options["with_allauth"]
+        fast_passwords = options["fast_passwords"]
+        purge = options["purge"]
+        parallel = max(1, options["parallel"])
+        batch_size = options["batch_size"] or os.environ.get(
+            "SEED_BULK_CREATE_BATCH_SIZE"
+        )
+        if batch_size:
+            batch_size = int(batch_size)
+        else:
+            # Size batches so each INSERT stays around 64 KB of SQL text:
+            # much larger and server-side parse time outgrows the saved
+            # per-statement overhead, much smaller and round trips dominate.
+            # The widest row we write is a user (~90 bytes of password hash,
+            # ~35 of email, ~15 of username, flags/timestamps the rest),
+            # roughly 200 bytes of VALUES text.
+            estimated_row_sql_bytes = 200
+            batch_size = max(50, 60_000 // estimated_row_sql_bytes)
+
+        if with_allauth and (EmailAddress is None or SocialAccount is None):
+            raise CommandError(
+                "django-allauth not available but --with-allauth was specified"
+            )
+
+        random.seed(seed)
+
+        # Purge existing data if requested
+        if purge:
+            self.stdout.write(self.style.WARNING("Purging existing data..."))
+
+            if connection.vendor == "postgresql":
+                # One TRUNCATE covers every table, including the M2M through
+                # tables, and resets the ID sequences — instead of the ORM
+                # loading PKs and issuing per-row cascading deletes. CASCADE
+                # picks up any other table referencing these (e.g. allauth
+                # social tokens). MySQL is not targeted here: it cannot
+                # truncate multiple FK-linked tables in one statement.
+                purge_models = [
+                    Team.students.through,
+                    Course.students.through,
+                    Team,
+                    Course,
+                    get_user_model(),
+                ]
+                if EmailAddress is not None:
+                    purge_models.insert(0, EmailAddress)
+                if SocialAccount is not None:
+                    purge_models.insert(0, SocialAccount)
+                tables = ", ".join(
+                    connection.ops.quote_name(m._meta.db_table) for m in purge_models
+                )
+                with connection.cursor() as cursor:
+                    cursor.execute(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE")
+            else:
+                # Delete in reverse dependency order to avoid foreign key constraints
+                if SocialAccount is not None:
+                    deleted_social = SocialAccount.objects.all().delete()
+                    self.stdout.write(f"Deleted {deleted_social[0]} SocialAccount records")
+
+                if EmailAddress is not None:
+                    deleted_emails = EmailAddress.objects.all().delete()
+                    self.stdout.write(f"Deleted {deleted_emails[0]} EmailAddress records")
+
+                # Delete teams first (they reference courses and users)
+                deleted_teams = Team.objects.all().delete()
+                self.stdout.write(f"Deleted {deleted_teams[0]} Team records")
+
+                # Delete courses (they reference users)
+                deleted_courses = Course.objects.all().delete()
+                self.stdout.write(f"Deleted {deleted_courses[0]} Course records")
+
+                # Delete all users
+                User = get_user_model()
+                deleted_users = User.objects.all().delete()
+                self.stdout.write(f"Deleted {deleted_users[0]} User records")
+
+            self.stdout.write(self.style.SUCCESS("Purge completed"))
+
+        config = LEVEL_CONFIG[level]
+        courses_target = config["courses_per_semester"]
+        students_min = config["students_min"]
+        students_max = config["students_max"]
+        team_min = config["team_min"]
+        team_max = config["team_max"]
+
+        self.stdout.write(
+            self.style.NOTICE(
+                f"Seeding level {level}: ~{courses_target} courses in {semester} {year}"
+            )
+        )
+
+        # On Postgres the insert workload becomes index-write-bound once the
+        # SQL overhead is gone, so secondary (non-PK, non-unique) indexes on
+        # the big target tables are dropped for the duration of the seed and
+        # rebuilt afterwards from their saved definitions. Unique indexes
+        # stay: the M2M ignore_conflicts handling and username/email
+        # integrity depend on them.
+        index_tables = [
+            get_user_model()._meta.db_table,
+            Course.students.through._meta.db_table,
+            Team.students.through._meta.db_table,
+        ]
+        dropped_index_ddl = []
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT c.relname, pg_get_indexdef(i.indexrelid)
+                    FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    JOIN pg_class t ON t.oid = i.indrelid
+                    WHERE t.relname = ANY(%s)
+                      AND NOT i.indisprimary
+                      AND NOT i.indisunique
+                    """,
+                    [index_tables],
+                )
+                for index_name, index_def in cursor.fetchall():
+                    cursor.execute(
+                        f"DROP INDEX {connection.ops.quote_name(index_name)}"
+                    )
+                    dropped_index_ddl.append(index_def)
+            if dropped_index_ddl:
+                self.stdout.write(
+                    self.style.NOTICE(
+                        f"Dropped {len(dropped_index_ddl)} secondary indexes for the seed"
+                    )
+                )
+
+        # Seed one shared password hash up front; every worker reuses it.
+        # --fast-passwords maps to the unusable-password marker
+        # make_password(None) produces.
+        try:
+            shared_password = make_password(None if fast_passwords else "Passw0rd!")
+
+            base_counter = int(random.random() * 1000)
+
+            if parallel == 1:
+                totals = seed_course_range(
+                    course_start=0,
+                    courses_count=courses_target,
+                    username_base=base_counter,
+                    config=config,
+                    semester=semester,
+                    year=year,
+                    seed=seed,
+                    with_allauth=with_allauth,
+                    shared_password=shared_password,
+                    batch_size=batch_size,
+                    stdout=self.stdout,
+                    style=self.style,
+                )
+            else:
+                # Contiguous disjoint course slices per worker, each with its own
+                # username-counter base so generated names never collide, its own
+                # random stream, and its own transaction.
+                per_worker = math.ceil(courses_target / parallel)
+                jobs = []
+                for worker_id in range(parallel):
+                    start = worker_id * per_worker
+                    count = min(per_worker, courses_target - start)
+                    if count <= 0:
+                        break
+                    jobs.append(
+                        dict(
+                            course_start=start,
+                            courses_count=count,
+                            username_base=base_counter + (worker_id + 1) * 10_000_000,
+                            config=config,
+                            semester=semester,
+                            year=year,
+                            seed=seed + worker_id,
+                            with_allauth=with_allauth,
+                            shared_password=shared_password,
+                            batch_size=batch_size,
+                        )
+                    )
+                # Close our own connection too: forked children must not share it.
+                connections.close_all()
+                totals = {"courses": 0, "professors": 0, "students": 0, "teams": 0}
+                with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                    for counts in pool.map(_seed_range_worker, jobs):
+                        for key, value in counts.items():
+                            totals[key] += value
+                        self.stdout.write(
+                            self.style.NOTICE(
+                                f"Worker finished: {counts['courses']} courses "
+                                f"({totals['courses']}/{courses_target} total)"
+                            )
+                        )
+        finally:
+            # Rebuild whatever was dropped, even if the seed failed midway.
+            if dropped_index_ddl:
+                with connection.cursor() as cursor:
+                    for index_def in dropped_index_ddl:
+                        cursor.execute(index_def)
+                self.stdout.write(
+                    self.style.NOTICE(
+                        f"Rebuilt {len(dropped_index_ddl)} secondary indexes"
+                    )
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {totals['courses']} courses, "
+                f"{totals['professors']} professors, {totals['students']} students, "
+                f"{totals['teams']} teams"
+            )
+        )
+
+    def show_detailed_help(self):
+        """Display detailed help information with examples and configurations."""
+        self.stdout.write(self.style.SUCCESS("CollabRate Data Seeding Command"))
+        self.stdout.write("=" * 50)
+        self.stdout.write("")
+        
+        self.stdout.write(self.style.WARNING("USAGE:"))
+        self.stdout.write("  python manage.py seed_data [OPTIONS]")
+        self.stdout.write("")
+        
+        self.stdout.write(self.style.WARNING("OPTIONS:"))
+        self.stdout.write("  --level {1,2,3}           Data volume level (default: 1)")
+        self.stdout.write("    Level 1: ~150 courses, 30-80 students, teams 4-8")
+        self.stdout.write("    Level 2: ~700 courses, 30-80 students, teams 4-6") 
+        self.stdout.write("    Level 3: ~2000 courses, 30-100 students, teams 4-6")
+        self.stdout.write("")
+        
+        self.stdout.write("  --semester {Spring,Fall}  Target semester (default: Spring)")
+        self.stdout.write("  --year YYYY              Target year (default: current year)")
+        self.stdout.write("  --seed N                 Random seed for reproducibility (default: 42)")
+        self.stdout.write("")
+        
+        self.stdout.write("  --with-allauth           Create EmailAddress and SocialAccount records")
+        self.stdout.write("                          (simulates Google OAuth users)")
+        self.stdout.write("  --fast-passwords         Use unusable passwords for speed")
+        self.stdout.write("                          (users can only login via social auth)")
+        self.stdout.write("  --purge                  Clear all existing data before seeding")
+        self.stdout.write("")
+        
+        self.stdout.write(self.style.WARNING("EXAMPLES:"))
+        self.stdout.write("  # Quick Level 1 test")
+        self.stdout.write("  python manage.py seed_data --level 1 --fast-passwords")
+        self.stdout.write("")
+        
+        self.stdout.write("  # Full Level 2 with allauth and purge")
+        self.stdout.write("  python manage.py seed_data --level 2 --with-allauth --purge --fast-passwords")
+        self.stdout.write("")
+        
+        self.stdout.write("  # Level 3 for stress testing")
+        self.stdout.write("  python manage.py seed_data --level 3 --semester Fall --year 2025 --fast-passwords")
+        self.stdout.write("")
+        
+        self.stdout.write(self.style.WARNING("PERFORMANCE NOTES:"))
+        self.stdout.write("  - Use --fast-passwords for large datasets (Level 2/3)")
+        self.stdout.write("  - --with-allauth adds extra time for social account creation")
+        self.stdout.write("  - Level 1: ~1-3 minutes, Level 2: ~5-20 minutes, Level 3: ~20-60+ minutes")
+        self.stdout.write("  - Progress updates shown every ~5% of courses")
+        self.stdout.write("")
+        
+        self.stdout.write(self.style.WARNING("DATA GENERATED:"))
+        self.stdout.write("  - CustomUser records (students and professors)")
+        self.stdout.write("  - Course records with join codes and colors")
+        self.stdout.write("  - Team records with student assignments")
+        self.stdout.write("  - Optional: EmailAddress and SocialAccount records")
+        self.stdout.write("")
+        
+        self.stdout.write(self.style.WARNING("DATABASE TABLES AFFECTED:"))
+        self.stdout.write("  - accounts_customuser (users)")
+        self.stdout.write("  - dashboard_course (courses)")
+        self.stdout.write("  - course_team (teams)")
+        self.stdout.write("  - course_team_students (team memberships)")
+        self.stdout.write("  - dashboard_course_students (course enrollments)")
+        if EmailAddress is not None:
+            self.stdout.write("  - account_emailaddress (if --with-allauth)")
+        if SocialAccount is not None:
+            self.stdout.write("  - socialaccount_socialaccount (if --with-allauth)")
@@ -1,144 +1,253 @@
-import os
-import random
-
-from locust import HttpUser, task, between
-from locust.exception import RescheduleTask
-
-# ---------- Django setup ----------
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings")
-
-import django
-django.setup() 
-
-from accounts.models import CustomUser
-
-
-# ---------- Constants ----------
-PASSWORD = "Passw0rd!"
-LOGIN_URL = "/accounts/login/"
-DASHBOARD_URL = "/dashboard/"
-
-
-# Pre-load usernames from DB
-STUDENT_USERNAMES = list(
-    CustomUser.objects.filter(user_type=CustomUser.STUDENT)
-    .values_list("username", flat=True)
-)
-PROFESSOR_USERNAMES = list(
-    CustomUser.objects.filter(user_type=CustomUser.PROFESSOR)
-    .values_list("username", flat=True)
-)
-
-
-def pick_username(usernames):
-    """
-    Pick a random username from a non-empty list.
-    Raise RescheduleTask if list is empty so Locust doesn’t break.
-    """
-    if not usernames:
-        raise RescheduleTask("No users available in the database for this user type")
-    return random.choice(usernames)
-
-
-class BaseDjangoUser(HttpUser):
-    """
-    Shared logic for StudentUser and ProfessorUser.
-    Handles login in on_start and then exposes a task that hits the dashboard.
-    """
-
-    abstract = True
-    wait_time = between(1, 3)
-    username_list = None
-
-    def on_start(self):
-        """
-        Called once when a simulated user starts.
-        Choose a username from DB
-        Load the login page to get CSRF token
-        POST credentials
-        Confirm we can reach the dashboard
-        """
-        if self.username_list is None:
-            raise RescheduleTask("No username list configured for this user type")
-        if not self.username_list:
-            raise RescheduleTask("No users available in the database for this user type")
-
-        username = pick_username(self.username_list)
-
-        # GET login page to set CSRF cookie
-        with self.client.get(
-            LOGIN_URL,
-            name="GET /accounts/login/",
-            catch_response=True,
-        ) as resp:
-            if resp.status_code != 200:
-                resp.failure(
-                    f"[LOGIN GET] status={resp.status_code}, "
-                    f"body={resp.text[:200]!r}"
-                )
-                raise RescheduleTask("login-page-failed")
-
-        # CSRF token is stored in cookie 'csrftoken'
-        csrftoken = self.client.cookies.get("csrftoken", "")
-
-        # POST login form
-        login_data = {
-            "login": username,
-            "password": PASSWORD,
-            "csrfmiddlewaretoken": csrftoken,
-        }
-        headers = {
-            "Referer": self.client.base_url + LOGIN_URL,
-        }
-
-        with self.client.post(
-            LOGIN_URL,
-            data=login_data,
-            headers=headers,
-            name="POST /accounts/login/",
-            allow_redirects=True,
-            catch_response=True,
-        ) as resp:
-            if resp.status_code not in (200, 302):
-                resp.failure(
-                    f"[LOGIN POST] user={username}, status={resp.status_code}, "
-                    f"body={resp.text[:200]!r}"
-                )
-                raise RescheduleTask(f"login-post-failed-{resp.status_code}")
-
-        # Hit dashboard to confirm login/redirect worked
-        with self.client.get(
-            DASHBOARD_URL,
-            name="GET /dashboard/",
-            catch_response=True,
-        ) as resp:
-            if resp.status_code != 200:
-                resp.failure(
-                    f"[DASHBOARD GET] user={username}, status={resp.status_code}, "
-                    f"body={resp.text[:200]!r}"
-                )
-                raise RescheduleTask("dashboard-failed")
-            else:
-                resp.success()
-
-    @task
-    def dashboard(self):
-        """
-        Simple steady-state task: after login, keep hitting dashboard
-        to generate load on the main page.
-        """
-        self.client.get(DASHBOARD_URL, name="GET /dashboard/")
-
-
-class StudentUser(BaseDjangoUser):
-    """
-    Locust user that logs in as a student.
-    """
-    username_list = STUDENT_USERNAMES
-
-
-class ProfessorUser(BaseDjangoUser):
-    """
-    Locust user that logs in as a professor.
-    """
-    username_list = PROFESSOR_USERNAMES
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from http.cookiejar import Cookie
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from locust import events, task, between
+from locust.contrib.fasthttp import FastHttpUser
+from locust.exception import RescheduleTask
+from locust.runners import MasterRunner
+
+# ---------- Django setup ----------
+# Deferred to the locust init event below: the master process (and plain
+# --list invocations) imports this file only to enumerate user classes and
+# should not pay for the Django app registry or any DB queries.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings")
+
+
+# ---------- Constants ----------
+PASSWORD = "Passw0rd!"
+LOGIN_URL = "/accounts/login/"
+DASHBOARD_URL = "/dashboard/"
+
+# One CSRF token per worker process: the login page is only fetched to mint
+# the csrftoken cookie, and an unexpired cookie/token pair works for any
+# anonymous login POST, so simulated users can share it instead of each
+# pulling a full rendered login page. Guarded by a lock because a worker
+# runs its users on many greenlets.
+_CSRF_CACHE = {"token": None, "ts": 0.0}
+_CSRF_LOCK = threading.Lock()
+_CSRF_TTL = 600  # seconds
+
+
+# Pre-load usernames, preferring a recent disk cache over the DB.
+_USERNAME_CACHE = Path(tempfile.gettempdir()) / "collabrate_usernames.json"
+_USERNAME_CACHE_TTL = 300  # seconds
+
+
+def _load_usernames(CustomUser):
+    """
+    Return (student_usernames, professor_usernames).
+
+    Every Locust worker process imports this module, so querying the ORM
+    here costs Django setup plus two table scans per worker spawn. The
+    first import writes both lists to a temp-dir JSON cache; later workers
+    read that until the TTL lapses, then refresh it.
+    """
+    try:
+        if time.time() - _USERNAME_CACHE.stat().st_mtime < _USERNAME_CACHE_TTL:
+            cached = json.loads(_USERNAME_CACHE.read_text())
+            return cached["students"], cached["professors"]
+    except (OSError, ValueError, KeyError):
+        pass  # no cache, stale mtime, or corrupt contents: hit the DB
+
+    # One scan over the user table partitioned in Python, instead of two
+    # filtered queries each walking it separately.
+    students = []
+    professors = []
+    rows = (
+        CustomUser.objects.filter(
+            user_type__in=[CustomUser.STUDENT, CustomUser.PROFESSOR]
+        )
+        .values_list("user_type", "username")
+        .iterator(chunk_size=5000)
+    )
+    for user_type, username in rows:
+        (students if user_type == CustomUser.STUDENT else professors).append(username)
+    # Write-then-rename so concurrent workers never read a partial file.
+    tmp_path = _USERNAME_CACHE.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"students": students, "professors": professors}))
+    os.replace(tmp_path, _USERNAME_CACHE)
+    return students, professors
+
+
+STUDENT_USERNAMES = []
+PROFESSOR_USERNAMES = []
+
+
+@events.init.add_listener
+def _preload_usernames(environment, **kwargs):
+    """
+    Fill the username lists once the runner exists.
+
+    Fires in local and worker runners but not on a distributed master,
+    which never logs users in. The lists are mutated in place so the user
+    classes (which hold references to them) see the data.
+    """
+    if isinstance(environment.runner, MasterRunner):
+        return
+
+    import django
+    django.setup()
+    from accounts.models import CustomUser
+
+    students, professors = _load_usernames(CustomUser)
+    STUDENT_USERNAMES[:] = students
+    PROFESSOR_USERNAMES[:] = professors
+    StudentUser._username_count = len(STUDENT_USERNAMES)
+    ProfessorUser._username_count = len(PROFESSOR_USERNAMES)
+
+
+class BaseDjangoUser(FastHttpUser):
+    """
+    Shared logic for StudentUser and ProfessorUser.
+    Handles login in on_start and then exposes a task that hits the dashboard.
+
+    FastHttpUser (geventhttpclient) keeps a persistent connection pool and
+    costs a fraction of the CPU per request that the requests-backed
+    HttpUser does, so one generator box can drive several times the users.
+    """
+
+    abstract = True
+    wait_time = between(1, 3)
+    network_timeout = 10.0
+    connection_timeout = 10.0
+    max_retries = 1
+    username_list = None
+    # Picking is hot path under thousands of simulated users: the list
+    # length is computed once per subclass and randrange is pre-bound, so
+    # on_start does one index instead of a helper call plus random.choice.
+    _username_count = 0
+    _rand = staticmethod(random.randrange)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.username_list is not None:
+            cls._username_count = len(cls.username_list)
+
+    def on_start(self):
+        """
+        Called once when a simulated user starts.
+        Choose a username from DB
+        Load the login page to get CSRF token
+        POST credentials
+        Confirm we can reach the dashboard
+        """
+        if not self._username_count:
+            raise RescheduleTask("No users available in the database for this user type")
+
+        username = self.username_list[self._rand(self._username_count)]
+
+        with _CSRF_LOCK:
+            csrftoken = _CSRF_CACHE["token"]
+            if csrftoken is not None and time.time() - _CSRF_CACHE["ts"] >= _CSRF_TTL:
+                csrftoken = None
+
+        if csrftoken is None:
+            csrftoken = self._refresh_csrf()
+        else:
+            self._set_csrf_cookie(csrftoken)
+
+        status = self._post_login(username, csrftoken)
+        if status == 403:
+            # Cached token went stale (or CSRF rotation changed underneath
+            # us): refresh from the login page and retry once.
+            csrftoken = self._refresh_csrf()
+            self._post_login(username, csrftoken, retrying=True)
+
+    def _refresh_csrf(self):
+        """GET the login page and cache its CSRF token for this worker."""
+        with self.client.get(
+            LOGIN_URL,
+            name="GET /accounts/login/",
+            catch_response=True,
+        ) as resp:
+            if resp.status_code != 200:
+                # Slice the raw bytes: .text would decode the whole body
+                # just to show a 200-char diagnostic.
+                resp.failure(
+                    f"[LOGIN GET] status={resp.status_code}, "
+                    f"body={resp.content[:200]!r}"
+                )
+                raise RescheduleTask("login-page-failed")
+        # CSRF token is stored in cookie 'csrftoken' (FastHttpSession keeps
+        # an http.cookiejar.CookieJar rather than a requests cookie dict)
+        csrftoken = next(
+            (c.value for c in self.client.cookiejar if c.name == "csrftoken"), ""
+        )
+        with _CSRF_LOCK:
+            _CSRF_CACHE["token"] = csrftoken
+            _CSRF_CACHE["ts"] = time.time()
+        return csrftoken
+
+    def _set_csrf_cookie(self, csrftoken):
+        """Plant the shared token in this client's jar without a request."""
+        host = urlsplit(self.client.base_url).hostname or ""
+        self.client.cookiejar.set_cookie(
+            Cookie(
+                0, "csrftoken", csrftoken, None, False, host, False, False,
+                "/", True, False, None, False, None, None, {},
+            )
+        )
+
+    def _post_login(self, username, csrftoken, retrying=False):
+        login_data = {
+            "login": username,
+            "password": PASSWORD,
+            "csrfmiddlewaretoken": csrftoken,
+        }
+        headers = {
+            "Referer": self.client.base_url + LOGIN_URL,
+        }
+
+        # Without allow_redirects the 302 to the dashboard is proof enough
+        # of a successful login — following it (and then GETting /dashboard/
+        # again to "confirm") rendered the most expensive page twice per
+        # ramp-up user. The steady-state dashboard task covers the endpoint.
+        with self.client.post(
+            LOGIN_URL,
+            data=login_data,
+            headers=headers,
+            name="POST /accounts/login/",
+            allow_redirects=False,
+            catch_response=True,
+        ) as resp:
+            if resp.status_code == 403 and not retrying:
+                resp.failure(f"[LOGIN POST] user={username}, stale CSRF token")
+                return 403
+            location = resp.headers.get("Location", "")
+            if resp.status_code != 302 or not location.endswith(DASHBOARD_URL):
+                resp.failure(
+                    f"[LOGIN POST] user={username}, status={resp.status_code}, "
+                    f"location={location!r}"
+                )
+                raise RescheduleTask(f"login-post-failed-{resp.status_code}")
+            resp.success()
+            return resp.status_code
+
+    @task
+    def dashboard(self):
+        """
+        Simple steady-state task: after login, keep hitting dashboard
+        to generate load on the main page.
+        """
+        self.client.get(DASHBOARD_URL, name="GET /dashboard/")
+
+
+class StudentUser(BaseDjangoUser):
+    """
+    Locust user that logs in as a student.
+    """
+    username_list = STUDENT_USERNAMES
+
+
+class ProfessorUser(BaseDjangoUser):
+    """
+    Locust user that logs in as a professor.
+    """
+    username_list = PROFESSOR_USERNAMES
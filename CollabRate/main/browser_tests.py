@@ -1,11 +1,13 @@
 # browser_tests.py
 import os
-import time
 import pytest
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from playwright.sync_api import sync_playwright
 
 # Selenium driver setup
@@ -37,11 +39,14 @@ def _make_driver(browser_name: str):
 
 SELENIUM_BROWSERS = ["google", "mozilla"]
 
-@pytest.fixture(params=SELENIUM_BROWSERS, scope="class")
+# One WebDriver boot per browser for the whole session — launching
+# chromedriver/geckodriver dwarfs any single test — with state wiped
+# between tests by the autouse reset fixture in TestBrowserUsability.
+@pytest.fixture(params=SELENIUM_BROWSERS, scope="session")
 def selenium_browser(request):
     return request.param
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def driver(selenium_browser):
     drv = _make_driver(selenium_browser)
     if drv is None:
@@ -49,7 +54,11 @@ def driver(selenium_browser):
     yield drv
     drv.quit()
 
-pytestmark = pytest.mark.django_db
+# No module-wide django_db mark: pytest-django grants DB access through
+# live_server itself (its autouse helper switches every test that uses the
+# fixture to transactional_db regardless of marks), so the explicit mark
+# was redundant. Dropping it is tidiness only — per-test DB handling is
+# unchanged.
 
 HOME_PATH = "/dashboard"
 FORM_INPUT_SELECTOR = "input[name='q']"
@@ -75,6 +84,43 @@ def level_config(level_name):
 
 # Tests 
 class TestBrowserUsability:
+    @pytest.fixture(autouse=True)
+    def _reset(self, driver, selenium_browser):
+        # Shared driver isolation. Chrome gets a throwaway DevTools browser
+        # context with its own tab per test — fresh cookies/storage for
+        # milliseconds instead of a 1-2 s process relaunch, mirroring the
+        # new_context pattern the Playwright tests use. Gecko has no
+        # equivalent, so Firefox falls back to wiping state afterwards.
+        if selenium_browser in ("google", "chrome"):
+            ctx = driver.execute_cdp_cmd("Target.createBrowserContext", {})[
+                "browserContextId"
+            ]
+            before = driver.window_handles
+            driver.execute_cdp_cmd(
+                "Target.createTarget",
+                {"url": "about:blank", "browserContextId": ctx},
+            )
+            # chromedriver exposes the new tab as "CDwindow-<targetId>", not
+            # the raw targetId, so diff the handle list instead of passing
+            # the CDP id to switch_to.window.
+            WebDriverWait(driver, 5).until(EC.new_window_is_opened(before))
+            handle = next(h for h in driver.window_handles if h not in before)
+            driver.switch_to.window(handle)
+            yield
+            driver.execute_cdp_cmd(
+                "Target.disposeBrowserContext", {"browserContextId": ctx}
+            )
+            driver.switch_to.window(driver.window_handles[0])
+        else:
+            yield
+            try:
+                driver.delete_all_cookies()
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except Exception:
+                pass
+
     def test_homepage_loads_and_has_title(self, live_server, driver, level_config):
         url = live_server.url + HOME_PATH
         driver.get(url)
@@ -84,12 +130,27 @@ class TestBrowserUsability:
         url = live_server.url + HOME_PATH
         driver.get(url)
         driver.set_window_size(1366, 800)
-        time.sleep(0.2)
-        width_desktop = driver.execute_script("return document.body.clientWidth;")
+        # Explicit conditions instead of fixed sleeps: return as soon as the
+        # layout has actually settled rather than always paying worst case.
+        width_desktop = WebDriverWait(driver, 2, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return document.body.clientWidth;")
+        )
 
         driver.set_window_size(375, 812)
-        time.sleep(0.2)
-        width_mobile = driver.execute_script("return document.body.clientWidth;")
+        # The wait predicate hands back the changed width itself, so the
+        # measurement that used to be a separate execute_script round trip
+        # rides along with the poll that was happening anyway. (resizeTo /
+        # CDP metrics overrides would batch further but are out: the former
+        # is a no-op headless, the latter Chrome-only while this matrix
+        # includes Firefox.)
+        width_mobile = WebDriverWait(driver, 2, poll_frequency=0.05).until(
+            lambda d: (
+                (w := d.execute_script("return document.body.clientWidth;"))
+                != width_desktop
+                and w
+            ),
+            message="viewport width did not change after resize",
+        )
         assert width_desktop != width_mobile
 
     def test_key_navigation_and_focus(self, live_server, driver, level_config):
@@ -99,10 +160,11 @@ class TestBrowserUsability:
         start_active = driver.switch_to.active_element
 
         body.send_keys(Keys.TAB)
-        time.sleep(0.1)
-        after_tab = driver.switch_to.active_element
-
-        if start_active == after_tab:
+        try:
+            WebDriverWait(driver, 1, poll_frequency=0.05).until(
+                lambda d: d.switch_to.active_element != start_active
+            )
+        except TimeoutException:
             pytest.skip("No focusable elements detected, cannot test TAB navigation.")
 
 
@@ -116,22 +178,37 @@ class TestBrowserUsability:
         inputs[0].clear()
         inputs[0].send_keys("test")
         submits[0].click()
-        time.sleep(0.3)
-        ok = driver.find_elements(By.CSS_SELECTOR, SUCCESS_MARKER_SELECTOR)
-        assert ok, "Expected success marker after form submit"
+        try:
+            WebDriverWait(driver, 2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, SUCCESS_MARKER_SELECTOR))
+            )
+        except TimeoutException:
+            pytest.fail("Expected success marker after form submit")
 
     def test_no_obvious_js_errors_on_load(self, live_server, driver, level_config):
+        # One navigation only. The old version navigated, installed the
+        # listener, then navigated again — which wiped the listener it had
+        # just installed and paid a second full page load for nothing.
+        # The guard keeps repeat runs on the shared driver from stacking
+        # duplicate handlers.
         driver.get(live_server.url + HOME_PATH)
         driver.execute_script(
             """
-            window.__errors = [];
-            window.addEventListener('error', function(e){ window.__errors.push(e.message || 'error'); });
+            if (!window.__installed) {
+                window.__errors = [];
+                window.addEventListener('error', function(e){ window.__errors.push(e.message || 'error'); });
+                window.__installed = true;
+            }
             """
         )
-        driver.get(live_server.url + HOME_PATH)
-        time.sleep(0.2)
+        WebDriverWait(driver, 2).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
         errors = driver.execute_script("return window.__errors;") or []
-        assert all("ReferenceError" not in e for e in errors), f"JS errors: {errors}"
+        # next() stops at the first offending entry instead of scanning the
+        # whole list, and names the culprit in the assertion message.
+        bad = next((e for e in errors if "ReferenceError" in e), None)
+        assert bad is None, f"JS error: {bad} (all={errors})"
 
     def test_navigation_perf_is_reasonable_for_level(self, live_server, driver, level_config):
         """
@@ -139,26 +216,33 @@ class TestBrowserUsability:
         This doesn't replace real perf testing, but it flags obvious regressions as data scales.
         """
         driver.get(live_server.url + HOME_PATH)
-        time.sleep(0.2)
+        WebDriverWait(driver, 2).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
 
-        nav_entry = driver.execute_script(
+        # Both timing shapes come back in one execute_script payload; each
+        # WebDriver call is a full JSON-wire round trip, so the old
+        # nav-entry-then-fallback pattern cost an extra request per run.
+        perf = driver.execute_script(
             """
             var e = (performance.getEntriesByType && performance.getEntriesByType('navigation')) || [];
-            if (e && e.length) {
-                var n = e[0];
-                return {
-                    dcl: n.domContentLoadedEventEnd, // ms from startTime(=0) for nav entries
-                    start: n.startTime
-                };
-            }
-            return null;
+            return {
+                nav: e.length ? {
+                    dcl: e[0].domContentLoadedEventEnd, // ms from startTime(=0) for nav entries
+                    start: e[0].startTime
+                } : null,
+                timing: (window.performance && performance.timing)
+                    ? JSON.parse(JSON.stringify(performance.timing))
+                    : null
+            };
             """
         )
 
-        if nav_entry and "dcl" in nav_entry and nav_entry["dcl"]:
+        nav_entry = perf.get("nav")
+        if nav_entry and nav_entry.get("dcl"):
             dcl_ms = float(nav_entry["dcl"])
         else:
-            timing = driver.execute_script("return window.performance && performance.timing ? performance.timing : null;")
+            timing = perf.get("timing")
             if not timing:
                 pytest.skip("No performance timing API available in this browser.")
             dcl_ms = float(timing.get("domContentLoadedEventEnd", 0) - timing.get("navigationStart", 0))
@@ -167,35 +251,43 @@ class TestBrowserUsability:
         assert dcl_ms <= threshold, f"[{level_config['name']}] DOMContentLoaded {dcl_ms:.0f}ms > {threshold}ms"
 
 # Playwright Safari (WebKit) Tests
-HEADLESS = os.getenv("PW_HEADLESS", "1") == "1"   
+HEADLESS = os.getenv("PW_HEADLESS", "1") == "1"
+
+# Launching WebKit is the dominant cost of each Safari test, so one browser
+# process serves the whole session; each test gets a fresh context (cookies
+# and storage isolated) with a page, which is cheap to open and close.
+@pytest.fixture(scope="session")
+def webkit():
+    with sync_playwright() as p:
+        try:
+            browser = p.webkit.launch(headless=HEADLESS)
+        except Exception:
+            pytest.skip("Playwright WebKit browser not available.")
+        yield browser
+        browser.close()
+
+@pytest.fixture
+def page(webkit):
+    context = webkit.new_context()
+    yield context.new_page()
+    context.close()
+
 @pytest.mark.usefixtures("live_server")
 class TestSafariPlaywright:
-    def test_safari_homepage_loads(self, live_server):
-        with sync_playwright() as p:
-            browser = p.webkit.launch(headless=HEADLESS)
-            page = browser.new_page()
-            page.goto(live_server.url)
-            assert page.title(), "Safari/WebKit should have a non-empty title"
-            browser.close()
+    def test_safari_homepage_loads(self, live_server, page):
+        page.goto(live_server.url)
+        assert page.title(), "Safari/WebKit should have a non-empty title"
 
-    def test_safari_layout_responsive(self, live_server):
-        with sync_playwright() as p:
-            browser = p.webkit.launch(headless=HEADLESS)
-            page = browser.new_page()
-            page.goto(live_server.url)
-            desktop_width = page.evaluate("document.body.clientWidth")
-            page.set_viewport_size({"width": 375, "height": 812})
-            mobile_width = page.evaluate("document.body.clientWidth")
-            assert desktop_width != mobile_width
-            browser.close()
-
-    def test_safari_js_no_errors(self, live_server):
-        with sync_playwright() as p:
-            browser = p.webkit.launch(headless=HEADLESS)
-            page = browser.new_page()
-            errors = []
-            page.on("pageerror", lambda e: errors.append(str(e)))
-            page.goto(live_server.url)
-            page.wait_for_load_state("domcontentloaded")
-            assert not errors, f"JS errors: {errors}"
-            browser.close()
\ No newline at end of file
+    def test_safari_layout_responsive(self, live_server, page):
+        page.goto(live_server.url)
+        desktop_width = page.evaluate("document.body.clientWidth")
+        page.set_viewport_size({"width": 375, "height": 812})
+        mobile_width = page.evaluate("document.body.clientWidth")
+        assert desktop_width != mobile_width
+
+    def test_safari_js_no_errors(self, live_server, page):
+        errors = []
+        page.on("pageerror", lambda e: errors.append(str(e)))
+        page.goto(live_server.url)
+        page.wait_for_load_state("domcontentloaded")
+        assert not errors, f"JS errors: {errors}"
\ No newline at end of file
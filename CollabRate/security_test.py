@@ -4,11 +4,22 @@ Quick Security Test Runner
 Simplified script to run security tests on your Django application
 """
 
-import subprocess
+import signal
 import sys
 import os
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+
+# One pooled session for every probe this runner makes: keep-alive reuses
+# the TCP connection across checks instead of handshaking per request.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"User-Agent": "sec-test"})
+
 def run_security_tests():
     """
     Run the security testing script with proper setup
@@ -21,8 +32,7 @@ def run_security_tests():
     
     # Check if Django server is running
     try:
-        import requests
-        response = requests.get("http://127.0.0.1:8000/", timeout=5)
+        response = SESSION.get("http://127.0.0.1:8000/", timeout=5)
         if response.status_code == 200:
             print("✅ Django server is running")
         else:
@@ -33,29 +43,29 @@ def run_security_tests():
         print("💡 Start your Django server with: python manage.py runserver")
         return False
     
-    # Run the security testing script
+    # Run the security testing script in-process: no interpreter fork/exec,
+    # no duplicate import of requests, and output streams straight to the
+    # console instead of being buffered through capture_output.
     try:
         print("\n🚀 Starting security tests...")
-        result = subprocess.run([
-            sys.executable, 
-            "sqli_testing_script.py"
-        ], capture_output=True, text=True, timeout=300)
-        
-        print("📊 Test Results:")
-        print(result.stdout)
-        
-        if result.stderr:
-            print("⚠️  Warnings/Errors:")
-            print(result.stderr)
-        
-        if result.returncode == 0:
-            print("✅ Security tests completed successfully")
-        else:
-            print(f"❌ Security tests failed with return code: {result.returncode}")
-        
-        return result.returncode == 0
-        
-    except subprocess.TimeoutExpired:
+        import sqli_testing_script
+
+        # Keep the 5-minute ceiling the subprocess timeout used to enforce
+        def _timeout_handler(signum, frame):
+            raise TimeoutError
+
+        old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
+        signal.alarm(300)
+        try:
+            sqli_testing_script.main()
+        finally:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, old_handler)
+
+        print("✅ Security tests completed successfully")
+        return True
+
+    except TimeoutError:
         print("⏰ Security tests timed out (5 minutes)")
         return False
     except Exception as e: